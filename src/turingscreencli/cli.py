@@ -1,11 +1,9 @@
 import argparse
+import importlib
 import logging
 import sys
 from importlib.metadata import version, PackageNotFoundError
-
-import usb.core
-
-from . import operations, transport
+from typing import Optional
 
 try:
     __version__ = version("turingscreencli")
@@ -14,14 +12,38 @@ except PackageNotFoundError:
 
 _LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
 _DATE_FORMAT = "%H:%M:%S"
+_logging_configured = False
+_parser: Optional[argparse.ArgumentParser] = None
 logger = logging.getLogger(__name__)
 
+# operations/transport pull in pyusb, PyCryptodome and Pillow, so they are only
+# imported once a command actually needs them (not for --help or --version).
+_LAZY_SUBMODULES = ("operations", "transport")
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f"{__package__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def configure_logging(verbosity: int) -> None:
-    """Configure root logging based on requested verbosity."""
+    """Configure root logging based on requested verbosity.
+
+    The stdout handler is installed on the first call only; later calls just
+    adjust the root level.
+    """
+    global _logging_configured
+
     root = logging.getLogger()
     level = _verbosity_to_level(verbosity)
 
+    if _logging_configured:
+        root.setLevel(level)
+        return
+
     if root.handlers:
         root.setLevel(level)
         for handler in root.handlers:
@@ -35,6 +57,7 @@ def configure_logging(verbosity: int) -> None:
         handlers=[logging.StreamHandler(sys.stdout)],
     )
     logging.captureWarnings(True)
+    _logging_configured = True
 
 
 def _verbosity_to_level(verbosity: int) -> int:
@@ -45,8 +68,36 @@ def _verbosity_to_level(verbosity: int) -> int:
     return logging.WARNING
 
 
+def _bounded_int(lo: int, hi: int):
+    """Return an argparse type accepting integers in ``[lo, hi]``.
+
+    Cheaper than ``choices=range(...)``, which argparse expands into the error message.
+    """
+
+    def _parse(value: str) -> int:
+        number = int(value)
+        if not lo <= number <= hi:
+            raise argparse.ArgumentTypeError(f"value {number} not in range {lo}-{hi}")
+        return number
+
+    # argparse names the type in "invalid <name> value" errors
+    _parse.__name__ = "int"
+    return _parse
+
+
 def create_parser() -> argparse.ArgumentParser:
-    """Build the command-line parser."""
+    """Return the command-line parser, building it on first use.
+
+    parse_args keeps no state on the parser, so one instance serves every run().
+    """
+    global _parser
+
+    if _parser is None:
+        _parser = _build_parser()
+    return _parser
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Turing Smart Screen CLI Tool - Control your Turing Smart Screen device via USB",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -101,9 +152,8 @@ def create_parser() -> argparse.ArgumentParser:
     brightness_parser = subparsers.add_parser("brightness", help="Set screen brightness")
     brightness_parser.add_argument(
         "--value",
-        type=int,
+        type=_bounded_int(0, 102),
         required=True,
-        choices=range(0, 103),
         metavar="[0-102]",
         help="Brightness value (0–102)",
     )
@@ -114,9 +164,8 @@ def create_parser() -> argparse.ArgumentParser:
     )
     save_parser.add_argument(
         "--brightness",
-        type=int,
+        type=_bounded_int(0, 102),
         default=102,
-        choices=range(0, 103),
         metavar="[0-102]",
         help="Brightness value (0-102, default: 102)",
     )
@@ -146,9 +195,8 @@ def create_parser() -> argparse.ArgumentParser:
     )
     save_parser.add_argument(
         "--sleep",
-        type=int,
+        type=_bounded_int(0, 255),
         default=0,
-        choices=range(0, 256),
         metavar="[0-255]",
         help="Sleep timeout (default: 0)",
     )
@@ -204,16 +252,22 @@ def _parse_device_selector(selector_str):
     """Parse device selector string into int index or string serial."""
     if selector_str is None:
         return None
-    # Try to parse as integer index
-    try:
+    # All-digit selectors are indices; anything else is kept as a serial to match.
+    # Checked up front because serials are the common input and int() would raise.
+    digits = selector_str.strip()
+    if digits[:1] in ("-", "+"):
+        digits = digits[1:]
+    if digits.isdecimal():
         return int(selector_str)
-    except ValueError:
-        # Return as string for serial matching
-        return selector_str
+    return selector_str
 
 
 def _list_devices() -> bool:
     """List all connected Turing Smart Screen devices."""
+    import usb.core
+
+    from . import transport
+
     devices = transport.find_all_usb_devices()
 
     if not devices:
@@ -244,17 +298,19 @@ def _list_devices() -> bool:
 
 def _get_device_info(dev) -> str:
     """Get a short description of the device for logging."""
+    from . import transport
+
     serial = transport.get_device_serial(dev)
     return f"device serial={serial} (bus={dev.bus:03d}, addr={dev.address:03d})"
 
 
-def run(argv=None, *, device_factory=transport.find_usb_device) -> int:
+def run(argv=None, *, device_factory=None) -> int:
     """Run the CLI with the provided arguments."""
     parser = create_parser()
     args = parser.parse_args(argv)
-    configure_logging(args.verbose)
 
-    # Handle list-devices separately (no device connection needed)
+    # Handle list-devices separately (no device connection needed). It prints its
+    # own output, so logging is left unconfigured; errors reach logging.lastResort.
     if args.command == "list-devices":
         try:
             _list_devices()
@@ -263,9 +319,16 @@ def run(argv=None, *, device_factory=transport.find_usb_device) -> int:
             logger.error("Error listing devices: %s", exc)
             return 1
 
+    configure_logging(args.verbose)
+
     # Parse device selector
     device_selector = _parse_device_selector(args.device)
 
+    if device_factory is None:
+        from . import transport
+
+        device_factory = transport.find_usb_device
+
     try:
         dev = device_factory(device_selector)
     except ValueError as exc:
@@ -278,9 +341,10 @@ def run(argv=None, *, device_factory=transport.find_usb_device) -> int:
         logger.error("Unexpected error: %s", exc)
         return 1
 
-    # Log which device was selected (always show this for multi-device setups)
-    device_info = _get_device_info(dev)
-    logger.info("Using %s", device_info)
+    # Log which device was selected (always show this for multi-device setups).
+    # Describing it reads the serial descriptor, so skip that when INFO is filtered.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Using %s", _get_device_info(dev))
 
     try:
         success = _dispatch_command(dev, args)
@@ -294,52 +358,56 @@ def run(argv=None, *, device_factory=transport.find_usb_device) -> int:
     return 0 if success else 1
 
 
+def _refresh_storage(ops, dev, args) -> bool:
+    ops.send_refresh_storage_command(dev)
+    return True
+
+
+def _save_settings(ops, dev, args) -> bool:
+    response = ops.send_save_settings_command(
+        dev,
+        brightness=args.brightness,
+        startup=args.startup,
+        reserved=args.reserved,
+        rotation=args.rotation,
+        sleep=args.sleep,
+        offline=args.offline,
+    )
+    return response is not None
+
+
+def _list_storage(ops, dev, args) -> bool:
+    path = "/tmp/sdcard/mmcblk0p1/img/" if args.type == "image" else "/tmp/sdcard/mmcblk0p1/video/"
+    ops.send_list_storage_command(dev, path)
+    return True
+
+
+# command -> (send delay_sync first, handler(operations, dev, args) -> success)
+_COMMANDS = {
+    "sync": (False, lambda ops, dev, args: ops.send_sync_command(dev) is not None),
+    "restart": (True, lambda ops, dev, args: ops.send_restart_device_command(dev) is not None),
+    "refresh-storage": (True, _refresh_storage),
+    "brightness": (True, lambda ops, dev, args: ops.send_brightness_command(dev, args.value) is not None),
+    "save": (True, _save_settings),
+    "list-storage": (True, _list_storage),
+    "clear-image": (True, lambda ops, dev, args: ops.clear_image(dev) is not None),
+    "send-image": (True, lambda ops, dev, args: ops.send_image(dev, args.path)),
+    "send-video": (True, lambda ops, dev, args: ops.send_video(dev, args.path, loop=args.loop)),
+    "stop-play": (True, lambda ops, dev, args: ops.stop_play(dev)),
+}
+
+
 def _dispatch_command(dev, args) -> bool:
-    command = args.command
+    from . import operations
 
-    if command == "sync":
-        return operations.send_sync_command(dev) is not None
-    if command == "restart":
-        operations.delay_sync(dev)
-        return operations.send_restart_device_command(dev) is not None
-    if command == "refresh-storage":
-        operations.delay_sync(dev)
-        operations.send_refresh_storage_command(dev)
-        return True
-    if command == "brightness":
-        operations.delay_sync(dev)
-        return operations.send_brightness_command(dev, args.value) is not None
-    if command == "save":
-        operations.delay_sync(dev)
-        response = operations.send_save_settings_command(
-            dev,
-            brightness=args.brightness,
-            startup=args.startup,
-            reserved=args.reserved,
-            rotation=args.rotation,
-            sleep=args.sleep,
-            offline=args.offline,
-        )
-        return response is not None
-    if command == "list-storage":
-        operations.delay_sync(dev)
-        path = "/tmp/sdcard/mmcblk0p1/img/" if args.type == "image" else "/tmp/sdcard/mmcblk0p1/video/"
-        operations.send_list_storage_command(dev, path)
-        return True
-    if command == "clear-image":
-        operations.delay_sync(dev)
-        return operations.clear_image(dev) is not None
-    if command == "send-image":
-        operations.delay_sync(dev)
-        return operations.send_image(dev, args.path)
-    if command == "send-video":
-        operations.delay_sync(dev)
-        return operations.send_video(dev, args.path, loop=args.loop)
-    if command == "stop-play":
-        operations.delay_sync(dev)
-        return operations.stop_play(dev)
+    entry = _COMMANDS.get(args.command)
+    if entry is None:
+        raise ValueError(f"Unsupported command: {args.command}")
 
-    raise ValueError(f"Unsupported command: {command}")
+    sync_first, handler = entry
+    if sync_first:
+        operations.delay_sync(dev)
+    return handler(operations, dev, args)
 
 
 def main(argv=None):
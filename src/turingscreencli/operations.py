@@ -19,6 +19,7 @@ logger = logging.getLogger(__name__)
 build_command_packet_header = transport.build_command_packet_header
 encrypt_command_packet = transport.encrypt_command_packet
 write_to_device = transport.write_to_device
+write_bulk = transport.write_bulk
 
 
 def delay_sync(dev) -> None:
@@ -472,8 +473,7 @@ def clear_image(dev):
     cmd_packet[10] = (img_size >> 8) & 0xFF
     cmd_packet[11] = img_size & 0xFF
 
-    full_payload = encrypt_command_packet(cmd_packet) + img_data
-    return write_to_device(dev, full_payload)
+    return write_bulk(dev, (encrypt_command_packet(cmd_packet), img_data))
 
 
 def delay(dev, rst):
@@ -557,8 +557,7 @@ def send_video(dev, video_path, loop: bool = False) -> bool:
                         cmd_packet[10] = (chunk_size >> 8) & 0xFF
                         cmd_packet[11] = chunk_size & 0xFF
 
-                        full_payload = encrypt_command_packet(cmd_packet) + data
-                        response = write_to_device(dev, full_payload)
+                        response = write_bulk(dev, (encrypt_command_packet(cmd_packet), data))
                         time.sleep(0.03)
 
                         if response is None or len(response) < 9 or response[8] <= 3:
@@ -623,8 +622,7 @@ def _send_png_bytes(dev, img_data, part: Optional[str] = None):
     cmd_packet[10] = (img_size >> 8) & 0xFF
     cmd_packet[11] = img_size & 0xFF
     logger.info("→ Transmitting [%s] - %d bytes", part or "image", img_size)
-    full_payload = encrypt_command_packet(cmd_packet) + img_data
-    return write_to_device(dev, full_payload)
+    return write_bulk(dev, (encrypt_command_packet(cmd_packet), img_data))
 
 
 def _open_file_command(dev, path: str):
@@ -666,7 +664,7 @@ def _write_file_command(dev, file_path: str) -> bool:
                 cmd_packet[10] = (chunk_size >> 8) & 0xFF
                 cmd_packet[11] = chunk_size & 0xFF
 
-                response = write_to_device(dev, encrypt_command_packet(cmd_packet) + data_chunk)
+                response = write_bulk(dev, (encrypt_command_packet(cmd_packet), data_chunk))
                 if response is None:
                     logger.error("Write command failed at chunk %d", chunk_index)
                     return False
@@ -2,51 +2,91 @@
 
 from __future__ import annotations
 
+import errno
 import logging
 import platform
 import struct
 import time
-from functools import partial
+from array import array
 
 import usb.core
 import usb.util
-from Crypto.Cipher import DES
 
 logger = logging.getLogger(__name__)
 
 VENDOR_ID = 0x1CBE
 PRODUCT_ID = 0x0088
 _DES_KEY = b"slv3tuzx"
-
-
-def _endpoint_matches_direction(endpoint, *, direction):
-    return usb.util.endpoint_direction(endpoint.bEndpointAddress) == direction
+# A multiple of every bulk max packet size (512 high speed, 1024 SuperSpeed), so
+# splitting a command across transfers never produces a short packet mid-stream.
+_BULK_TRANSFER_SIZE = 2 * 1024 * 1024
+# Zeroed 512-byte packet with the fixed 0xA1 0x1A trailer already in place.
+_PACKET_TEMPLATE = bytes(510) + b"\xa1\x1a"
+# Header prefix: command id, reserved zero byte, 0x1A 0x6D magic, little-endian timestamp.
+_HEADER_FIELDS = struct.Struct("<BxBBI")
+# Scratch space for zero-padding command packets before encryption. Packets are
+# built and encrypted on the caller's thread, so a single buffer is enough.
+_PAD_BUFFER = bytearray(512)
+
+# Local midnight for the current day and the next one, refreshed on rollover.
+_midnight_epoch = 0.0
+_next_midnight_epoch = 0.0
+
+# (ep_out, ep_in) resolved once instead of on every write. Stored as an attribute of the
+# device object: pyusb devices compare and hash equal by (backend, bus, address), and each
+# endpoint holds its device, so a mapping keyed on devices would neither expire entries
+# nor keep a new device at the same address from getting a stale handle's endpoints.
+_ENDPOINTS_ATTR = "_turingscreencli_endpoints"
+# Serial string descriptor, cached on the device object for the same reason.
+_SERIAL_ATTR = "_turingscreencli_serial"
+
+# Last non-empty enumeration as (monotonic timestamp, sorted devices).
+_DEVICE_LIST_TTL = 10.0
+_device_list_cache: tuple[float, list] | None = None
+
+
+def _milliseconds_since_midnight() -> int:
+    """Return milliseconds elapsed since local midnight."""
+    global _midnight_epoch, _next_midnight_epoch
+
+    now = time.time()
+    if not _midnight_epoch <= now < _next_midnight_epoch:
+        year, month, day = time.localtime(now)[:3]
+        # mktime normalises day + 1 and resolves DST, so days of 23 or 25 hours are handled
+        _midnight_epoch = time.mktime((year, month, day, 0, 0, 0, 0, 0, -1))
+        _next_midnight_epoch = time.mktime((year, month, day + 1, 0, 0, 0, 0, 0, -1))
+    return int((now - _midnight_epoch) * 1000)
 
 
 def build_command_packet_header(command_id: int) -> bytearray:
     """Build a command packet header for the provided command id."""
     packet = bytearray(500)
-    packet[0] = command_id
-    packet[2] = 0x1A
-    packet[3] = 0x6D
-    timestamp = int((time.time() - time.mktime(time.localtime()[:3] + (0, 0, 0, 0, 0, -1))) * 1000)
-    packet[4:8] = struct.pack("<I", timestamp)
+    _HEADER_FIELDS.pack_into(packet, 0, command_id, 0x1A, 0x6D, _milliseconds_since_midnight())
     return packet
 
 
 def encrypt_with_des(key: bytes, data: bytes) -> bytes:
+    from Crypto.Cipher import DES
+
+    # CBC ciphers are stateful, so a fresh one is needed for every packet. PyCryptodome
+    # sets one up faster than cryptography's Cipher/encryptor pair, so it stays the backend.
     cipher = DES.new(key, DES.MODE_CBC, key)
-    padded_len = (len(data) + 7) // 8 * 8
-    padded_data = data.ljust(padded_len, b"\x00")
-    return cipher.encrypt(padded_data)
+    length = len(data)
+    padded_len = (length + 7) & ~7
+    if padded_len > len(_PAD_BUFFER):
+        padded_data = bytearray(padded_len)
+        padded_data[:length] = data
+        return cipher.encrypt(padded_data)
+
+    _PAD_BUFFER[:length] = data
+    _PAD_BUFFER[length:padded_len] = bytes(padded_len - length)
+    return cipher.encrypt(memoryview(_PAD_BUFFER)[:padded_len])
 
 
 def encrypt_command_packet(data: bytearray) -> bytearray:
     encrypted = encrypt_with_des(_DES_KEY, data)
-    final_packet = bytearray(512)
+    final_packet = bytearray(_PACKET_TEMPLATE)
     final_packet[: len(encrypted)] = encrypted
-    final_packet[510] = 161
-    final_packet[511] = 26
     return final_packet
 
 
@@ -64,14 +104,20 @@ def _configure_device(dev):
         except usb.core.USBError as exc:
             logger.warning("detach_kernel_driver failed: %s", exc)
 
+    _get_endpoints(dev)
     return dev
 
 
 def get_device_serial(dev) -> str:
     """Get the serial number for a device, or fallback to bus:address."""
+    serial = getattr(dev, _SERIAL_ATTR, None)
+    if serial is not None:
+        return serial
+
     try:
         serial = dev.serial_number
         if serial:
+            setattr(dev, _SERIAL_ATTR, serial)
             return serial
     except (usb.core.USBError, ValueError):
         pass
@@ -79,14 +125,29 @@ def get_device_serial(dev) -> str:
 
 
 def find_all_usb_devices() -> list:
-    """Find all connected Turing Smart Screen devices, sorted by serial number."""
+    """Find all connected Turing Smart Screen devices, sorted by serial number.
+
+    A non-empty result is reused for ``_DEVICE_LIST_TTL`` seconds, so flows that
+    list and then select a device only walk the bus once.
+    """
+    global _device_list_cache
+
+    now = time.monotonic()
+    if _device_list_cache is not None and now - _device_list_cache[0] < _DEVICE_LIST_TTL:
+        return list(_device_list_cache[1])
+
     devices = usb.core.find(idVendor=VENDOR_ID, idProduct=PRODUCT_ID, find_all=True)
     if devices is None:
         return []
-    device_list = list(devices)
-    # Sort by serial number for stable ordering
-    device_list.sort(key=get_device_serial)
-    return device_list
+    # Read each serial once, sort on it for stable ordering, and remember it (even
+    # the bus:address fallback) so listing and selection don't re-read descriptors
+    keyed = sorted(((get_device_serial(dev), dev) for dev in devices), key=lambda pair: pair[0])
+    for serial, dev in keyed:
+        setattr(dev, _SERIAL_ATTR, serial)
+    device_list = [dev for _, dev in keyed]
+    if device_list:
+        _device_list_cache = (now, device_list)
+    return list(device_list)
 
 
 def find_usb_device(device_selector=None):
@@ -140,49 +201,110 @@ def find_usb_device(device_selector=None):
     raise ValueError(f"No device found matching '{serial_str}'")
 
 
-def read_flush(ep_in, max_attempts: int = 5) -> None:
+def read_flush(ep_in, max_attempts: int = 5, timeout: int = 1) -> None:
+    """Discard queued IN data, stopping at the first timeout or other USB error.
+
+    Extra packets of a reply are already queued once its first packet has been read, so
+    a 1 ms timeout is enough to drain them; an empty queue no longer costs 100 ms.
+    """
     for _ in range(max_attempts):
         try:
-            ep_in.read(512, timeout=100)
-        except usb.core.USBError as exc:
-            if exc.errno == 110 or exc.args[0] == "Operation timed out":
-                break
+            ep_in.read(512, timeout=timeout)
+        except usb.core.USBError:
             break
 
 
-def write_to_device(dev, data, timeout: int = 2000):
+def _get_endpoints(dev):
+    """Return the cached (OUT, IN) bulk endpoints of interface 0."""
+    endpoints = getattr(dev, _ENDPOINTS_ATTR, None)
+    if endpoints is not None:
+        return endpoints
+
     cfg = dev.get_active_configuration()
     intf = usb.util.find_descriptor(cfg, bInterfaceNumber=0)
     if intf is None:
         raise RuntimeError("USB interface 0 not found")
 
-    ep_out = usb.util.find_descriptor(
-        intf,
-        custom_match=partial(
-            _endpoint_matches_direction,
-            direction=usb.util.ENDPOINT_OUT,
-        ),
-    )
-    ep_in = usb.util.find_descriptor(
-        intf,
-        custom_match=partial(
-            _endpoint_matches_direction,
-            direction=usb.util.ENDPOINT_IN,
-        ),
-    )
+    # One pass over the interface's endpoints, taking the first of each direction
+    ep_out = ep_in = None
+    for endpoint in intf:
+        direction = usb.util.endpoint_direction(endpoint.bEndpointAddress)
+        if direction == usb.util.ENDPOINT_OUT:
+            if ep_out is None:
+                ep_out = endpoint
+        elif ep_in is None:
+            ep_in = endpoint
+        if ep_out is not None and ep_in is not None:
+            break
+
     if ep_out is None or ep_in is None:
         raise RuntimeError("Unable to locate USB endpoints")
 
+    endpoints = (ep_out, ep_in)
+    setattr(dev, _ENDPOINTS_ATTR, endpoints)
+    return endpoints
+
+
+def _handle_usb_error(dev, exc) -> None:
+    """Drop cached state for a device that has gone away."""
+    global _device_list_cache
+
+    if getattr(exc, "errno", None) == errno.ENODEV:
+        setattr(dev, _ENDPOINTS_ATTR, None)
+        setattr(dev, _SERIAL_ATTR, None)
+        _device_list_cache = None
+
+
+def _read_response(dev, ep_in, timeout: int):
+    try:
+        response = ep_in.read(512, timeout)
+        # Drop any further reply packets so they can't be mistaken for the next response
+        read_flush(ep_in)
+        return bytes(response)
+    except usb.core.USBError as exc:
+        _handle_usb_error(dev, exc)
+        logger.error("USB read error: %s", exc)
+        return None
+
+
+def write_to_device(dev, data, timeout: int = 2000):
+    ep_out, ep_in = _get_endpoints(dev)
+
     try:
         ep_out.write(data, timeout)
     except usb.core.USBError as exc:
+        _handle_usb_error(dev, exc)
         logger.error("USB write error: %s", exc)
         return None
 
+    return _read_response(dev, ep_in, timeout)
+
+
+def write_bulk(dev, chunks, *, transfer_size: int = _BULK_TRANSFER_SIZE, timeout: int = 2000):
+    """Send ``chunks`` as one command and read the device's single response.
+
+    The chunks (typically an encrypted command packet followed by its payload) are
+    coalesced into bulk transfers of up to ``transfer_size`` bytes. They are gathered
+    straight into the ``array('B')`` pyusb hands to libusb, so the payload is copied
+    once instead of being concatenated by the caller and converted again by pyusb.
+    """
+    if transfer_size <= 0 or transfer_size % 1024:
+        raise ValueError(f"transfer_size must be a positive multiple of 1024, got {transfer_size}")
+
+    ep_out, ep_in = _get_endpoints(dev)
+    pending = array("B")
+
     try:
-        response = ep_in.read(512, timeout)
-        read_flush(ep_in)
-        return bytes(response)
+        for chunk in chunks:
+            pending.frombytes(chunk)
+            while len(pending) >= transfer_size:
+                ep_out.write(pending[:transfer_size], timeout)
+                del pending[:transfer_size]
+        if pending:
+            ep_out.write(pending, timeout)
     except usb.core.USBError as exc:
-        logger.error("USB read error: %s", exc)
+        _handle_usb_error(dev, exc)
+        logger.error("USB write error: %s", exc)
         return None
+
+    return _read_response(dev, ep_in, timeout)
@@ -1,3 +1,12 @@
+import argparse
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
 import turingscreencli.cli as cli
 
 
@@ -23,6 +32,36 @@ def test_create_parser_includes_commands():
     assert args.path == "img.png"
 
 
+def test_create_parser_is_cached():
+    assert cli.create_parser() is cli.create_parser()
+
+
+@pytest.mark.parametrize("value", ["-1", "103", "abc"])
+def test_brightness_value_out_of_range_is_rejected(value, capsys):
+    parser = cli.create_parser()
+
+    with pytest.raises(SystemExit) as excinfo:
+        parser.parse_args(["brightness", "--value", value])
+
+    assert excinfo.value.code == 2
+    assert "argument --value" in capsys.readouterr().err
+
+
+def test_save_sleep_accepts_bounds():
+    parser = cli.create_parser()
+
+    assert parser.parse_args(["save", "--sleep", "255"]).sleep == 255
+    assert parser.parse_args(["save"]).brightness == 102
+
+
+@pytest.mark.parametrize(
+    ("selector", "expected"),
+    [(None, None), ("0", 0), ("2", 2), ("-1", -1), ("0f23f651", "0f23f651"), ("", ""), ("-", "-")],
+)
+def test_parse_device_selector(selector, expected):
+    assert cli._parse_device_selector(selector) == expected
+
+
 def test_run_sync_success(monkeypatch):
     monkeypatch.setattr(cli, "configure_logging", _noop)
 
@@ -68,3 +107,66 @@ def test_run_send_image_failure(monkeypatch):
     rc = cli.run(["send-image", "--path", "missing.png"], device_factory=lambda _: MockDevice())
 
     assert rc == 1
+
+
+def test_import_does_not_load_usb_stack():
+    src = Path(cli.__file__).resolve().parents[1]
+    code = (
+        "import sys, turingscreencli.cli; "
+        "print(any(m in sys.modules for m in ('usb', 'Crypto', 'PIL', 'turingscreencli.transport')))"
+    )
+    env = dict(os.environ, PYTHONPATH=str(src))
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+
+    assert result.stdout.strip() == "False"
+
+
+def test_run_skips_device_description_when_info_disabled(monkeypatch):
+    monkeypatch.setattr(cli, "configure_logging", _noop)
+    monkeypatch.setattr(cli.operations, "send_sync_command", lambda dev: b"ok")
+    monkeypatch.setattr(cli.logger, "isEnabledFor", lambda level: False)
+
+    def fail(dev):
+        raise AssertionError("device info should not be computed")
+
+    monkeypatch.setattr(cli, "_get_device_info", fail)
+
+    assert cli.run(["sync"], device_factory=lambda _: MockDevice()) == 0
+
+
+def test_configure_logging_installs_handler_once(monkeypatch):
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+    monkeypatch.setattr(logging, "captureWarnings", _noop)
+    monkeypatch.setattr(cli, "_logging_configured", False)
+
+    cli.configure_logging(0)
+    handlers = list(root.handlers)
+    cli.configure_logging(2)
+
+    assert len(handlers) == 1
+    assert root.handlers == handlers
+    assert root.level == logging.DEBUG
+
+
+def test_dispatch_command_rejects_unknown_command():
+    with pytest.raises(ValueError, match="Unsupported command"):
+        cli._dispatch_command(MockDevice(), argparse.Namespace(command="bogus"))
+
+
+def test_dispatch_covers_every_device_subcommand():
+    parser = cli.create_parser()
+    subparsers = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+
+    assert set(subparsers.choices) - {"list-devices"} == set(cli._COMMANDS)
+
+
+def test_run_list_devices_skips_logging_setup(monkeypatch):
+    def fail(verbosity):
+        raise AssertionError("list-devices should not configure logging")
+
+    monkeypatch.setattr(cli, "configure_logging", fail)
+    monkeypatch.setattr(cli.transport, "find_all_usb_devices", lambda: [])
+
+    assert cli.run(["list-devices"]) == 0
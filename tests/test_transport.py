@@ -0,0 +1,241 @@
+import errno
+import gc
+import struct
+import time
+import weakref
+
+from turingscreencli import transport
+
+
+def test_build_command_packet_header_layout():
+    packet = transport.build_command_packet_header(121)
+
+    assert len(packet) == 500
+    assert packet[0] == 121
+    assert packet[1] == 0
+    assert packet[2:4] == b"\x1a\x6d"
+    assert not any(packet[8:])
+
+
+def test_header_timestamp_is_milliseconds_since_local_midnight():
+    packet = transport.build_command_packet_header(10)
+
+    (timestamp,) = struct.unpack_from("<I", packet, 4)
+    midnight = time.mktime(time.localtime()[:3] + (0, 0, 0, 0, 0, -1))
+    expected = int((time.time() - midnight) * 1000)
+    assert 0 <= expected - timestamp < 1000
+
+
+def test_encrypt_command_packet_has_trailer():
+    packet = transport.encrypt_command_packet(transport.build_command_packet_header(10))
+
+    assert len(packet) == 512
+    assert packet[510:] == b"\xa1\x1a"
+
+
+class FakeEndpoint:
+    """Bulk endpoint sharing a reply queue with its peer; each write queues a reply and one extra packet."""
+
+    def __init__(self, address, replies=None):
+        self.bEndpointAddress = address
+        self.replies = [] if replies is None else replies
+        self.written = []
+        self.read_timeouts = []
+
+    def write(self, data, timeout):
+        self.written.append(bytes(data))
+        self.replies.extend([b"ok", b"extra"])
+        return len(data)
+
+    def read(self, size, timeout):
+        self.read_timeouts.append(timeout)
+        if not self.replies:
+            raise transport.usb.core.USBError("Operation timed out", errno=errno.ETIMEDOUT)
+        return bytearray(self.replies.pop(0))
+
+
+class FakeInterface(list):
+    bInterfaceNumber = 0
+    bAlternateSetting = 0
+
+
+class FakeDevice:
+    bus = 1
+    address = 2
+
+    def __init__(self):
+        self.ep_out = FakeEndpoint(0x01)
+        self.ep_in = FakeEndpoint(0x81, self.ep_out.replies)
+        self.config_lookups = 0
+
+    def get_active_configuration(self):
+        self.config_lookups += 1
+        return [FakeInterface([self.ep_out, self.ep_in])]
+
+
+def test_write_to_device_resolves_endpoints_once():
+    dev = FakeDevice()
+
+    assert transport.write_to_device(dev, b"first") == b"ok"
+    assert transport.write_to_device(dev, b"second") == b"ok"
+
+    assert dev.config_lookups == 1
+    assert dev.ep_out.written == [b"first", b"second"]
+
+
+def test_get_endpoints_matches_by_direction():
+    dev = FakeDevice()
+    dev.get_active_configuration = lambda: [FakeInterface([dev.ep_in, dev.ep_out])]
+
+    assert transport._get_endpoints(dev) == (dev.ep_out, dev.ep_in)
+
+
+class PyusbLikeEndpoint(FakeEndpoint):
+    def __init__(self, address, device, replies=None):
+        super().__init__(address, replies)
+        self.device = device
+
+
+class PyusbLikeDevice(FakeDevice):
+    """Like usb.core.Device: equal by bus/address, endpoints referencing the device."""
+
+    def __init__(self):
+        super().__init__()
+        self.ep_out = PyusbLikeEndpoint(0x01, self)
+        self.ep_in = PyusbLikeEndpoint(0x81, self, self.ep_out.replies)
+
+    def __eq__(self, other):
+        return isinstance(other, PyusbLikeDevice) and (self.bus, self.address) == (other.bus, other.address)
+
+    def __hash__(self):
+        return hash((self.bus, self.address))
+
+
+def test_endpoints_are_not_shared_between_equal_devices():
+    old = PyusbLikeDevice()
+    transport.write_to_device(old, b"ping")
+
+    new = PyusbLikeDevice()
+    assert new == old
+    ep_out, ep_in = transport._get_endpoints(new)
+
+    assert ep_out.device is new
+    assert ep_in.device is new
+
+
+def test_cached_endpoints_do_not_keep_device_alive():
+    dev = PyusbLikeDevice()
+    dev.address = 3
+    transport.write_to_device(dev, b"ping")
+    ref = weakref.ref(dev)
+
+    del dev
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_write_to_device_drains_extra_reply_packets_quickly():
+    dev = FakeDevice()
+
+    assert transport.write_to_device(dev, b"ping") == b"ok"
+
+    # response, one queued extra packet, then the 1 ms drain read that times out
+    assert dev.ep_in.read_timeouts == [2000, 1, 1]
+
+
+def test_write_bulk_coalesces_chunks_into_one_transfer():
+    dev = FakeDevice()
+
+    assert transport.write_bulk(dev, (b"\x01" * 512, b"\x02" * 100)) == b"ok"
+
+    assert dev.ep_out.written == [b"\x01" * 512 + b"\x02" * 100]
+
+
+def test_write_bulk_splits_at_transfer_size():
+    dev = FakeDevice()
+    payload = bytes(range(256)) * 10
+
+    transport.write_bulk(dev, (payload[:512], payload[512:]), transfer_size=1024)
+
+    assert [len(chunk) for chunk in dev.ep_out.written] == [1024, 1024, 512]
+    assert b"".join(dev.ep_out.written) == payload
+
+
+class SerialDevice:
+    bus = 1
+
+    def __init__(self, serial, address):
+        self._serial = serial
+        self.address = address
+        self.serial_reads = 0
+
+    @property
+    def serial_number(self):
+        self.serial_reads += 1
+        return self._serial
+
+
+def test_find_all_usb_devices_reuses_recent_enumeration(monkeypatch):
+    devices = [SerialDevice("b", 1), SerialDevice("a", 2)]
+    calls = []
+
+    def fake_find(**kwargs):
+        calls.append(kwargs)
+        return iter(devices)
+
+    monkeypatch.setattr(transport, "_device_list_cache", None)
+    monkeypatch.setattr(transport.usb.core, "find", fake_find)
+
+    first = transport.find_all_usb_devices()
+    second = transport.find_all_usb_devices()
+
+    assert [transport.get_device_serial(d) for d in first] == ["a", "b"]
+    assert second == first
+    assert len(calls) == 1
+    assert all(d.serial_reads == 1 for d in devices)
+
+
+def test_serial_is_not_shared_between_equal_devices():
+    class EqualSerialDevice(SerialDevice):
+        def __eq__(self, other):
+            return isinstance(other, SerialDevice) and (self.bus, self.address) == (other.bus, other.address)
+
+        def __hash__(self):
+            return hash((self.bus, self.address))
+
+    old = EqualSerialDevice("old-serial", 9)
+    assert transport.get_device_serial(old) == "old-serial"
+
+    new = EqualSerialDevice("new-serial", 9)
+    assert new == old
+    assert transport.get_device_serial(new) == "new-serial"
+
+
+def test_disconnect_error_drops_cached_device_state(monkeypatch):
+    dev = FakeDevice()
+    transport.write_to_device(dev, b"ping")
+    monkeypatch.setattr(transport, "_device_list_cache", (0.0, [dev]))
+
+    transport._handle_usb_error(dev, transport.usb.core.USBError("gone", errno=errno.ENODEV))
+
+    assert getattr(dev, transport._ENDPOINTS_ATTR) is None
+    assert getattr(dev, transport._SERIAL_ATTR, None) is None
+    assert transport._device_list_cache is None
+
+
+def test_find_all_usb_devices_remembers_fallback_serial(monkeypatch):
+    class NoSerialDevice(SerialDevice):
+        @property
+        def serial_number(self):
+            self.serial_reads += 1
+            raise ValueError("no langid")
+
+    dev = NoSerialDevice(None, 7)
+    monkeypatch.setattr(transport, "_device_list_cache", None)
+    monkeypatch.setattr(transport.usb.core, "find", lambda **kwargs: iter([dev]))
+
+    (found,) = transport.find_all_usb_devices()
+
+    assert transport.get_device_serial(found) == "bus001:007"
+    assert dev.serial_reads == 1